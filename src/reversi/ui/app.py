@@ -1,7 +1,7 @@
 import sys
 import asyncio
 from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QTextEdit, QPushButton, QHBoxLayout, QLabel, QFileDialog, QComboBox
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
 from qasync import QEventLoop
 
 from reversi.protocol.interface import EngineInterface
@@ -19,12 +19,19 @@ from .styles import get_main_stylesheet
 from reversi.engine.metadata import get_engine_metadata
 from reversi.engine.router_engine import RouterEngine
 
+# Oldest engine log lines are discarded beyond this many
+_LOG_MAX_LINES = 2000
+
 class ReversiApp(QMainWindow):
     def __init__(self, engine: EngineInterface, board_size: int = 8):
         super().__init__()
         self.broker = EngineBroker(engine)
         self.protocol_engine = engine # Reference for direct config
         self.state = GameState(board_size=board_size)
+        # Log lines are buffered and flushed to the view once per event loop turn
+        self._log_buffer = []
+        # Control state refreshes requested while handling one event are applied once
+        self._ui_state_pending = False
 
         self.setWindowTitle(f"Reversi {board_size}x{board_size} (PySide6)")
         self.resize(1080, 900)
@@ -49,7 +56,7 @@ class ReversiApp(QMainWindow):
 
         self._setup_ui()
         self._connect_signals()
-        self.update_ui_state()
+        self._refresh_ui_state()
 
     def _sync_engine_configs(self):
         if not isinstance(self.protocol_engine, RouterEngine):
@@ -165,6 +172,7 @@ class ReversiApp(QMainWindow):
 
         self.log_view = QTextEdit()
         self.log_view.setReadOnly(True)
+        self.log_view.document().setMaximumBlockCount(_LOG_MAX_LINES)
         sidebar_layout.addWidget(self.log_view, stretch=1)
 
         main_layout.addWidget(sidebar)
@@ -198,12 +206,31 @@ class ReversiApp(QMainWindow):
         self.broker.game_over.connect(self.on_game_over)
 
     def log(self, text):
-        self.log_view.append(text)
+        if not self._log_buffer:
+            QTimer.singleShot(0, self._flush_log)
+        self._log_buffer.append(text)
+
+    def _flush_log(self):
+        lines = self._log_buffer
+        self._log_buffer = []
+        if lines:
+            self.log_view.append("\n".join(lines))
 
     def on_board_received(self, size, turn, state_str):
         self.state.current_turn = turn
         self.state.current_valid_moves = []
-        self.update_board_ui(size, state_str)
+
+        # Intermediate positions of a multi-step undo are superseded by the next
+        # BOARD update, so they are not rendered
+        if self.state.undo_expect_updates > 1:
+            self.state.undo_expect_updates -= 1
+            self.log("System: Waiting for second undo board update...")
+            return
+
+        # A malformed board must not reach the timeline or drive further engine commands
+        if not self.update_board_ui(size, state_str):
+            return
+        state_str = state_str[:size * size]
 
         player = self.state.players[turn]
         self.scoreboard.set_status(turn, player["name"], player["is_human"])
@@ -212,9 +239,6 @@ class ReversiApp(QMainWindow):
         processed_undo = False
         if self.state.undo_expect_updates > 0:
             self.state.undo_expect_updates -= 1
-            if self.state.undo_expect_updates > 0:
-                self.log("System: Waiting for second undo board update...")
-                return
             self.log("System: Undo completed")
             processed_undo = True
             self.replay_controller.sync_index(max(0, len(self.state.timeline) - 1))
@@ -247,8 +271,10 @@ class ReversiApp(QMainWindow):
                 self.send_command(f"{Command.GENMOVE} {self.state.current_turn}")
 
     def on_valid_moves_received(self, moves):
-        self.state.current_valid_moves = moves
         self.board_widget.set_valid_moves(moves)
+        if moves == self.state.current_valid_moves:
+            return
+        self.state.current_valid_moves = moves
         self.update_ui_state()
 
     def on_scores_received(self, black, white):
@@ -283,9 +309,7 @@ class ReversiApp(QMainWindow):
 
     def load_game_data(self, data: dict):
         try:
-            self.board_widget.set_state({})
-            self.board_widget.set_valid_moves([])
-            self.board_widget.set_analysis({})
+            self.board_widget.reset()
 
             loaded = game_state_serializer.deserialize(
                 data,
@@ -316,12 +340,14 @@ class ReversiApp(QMainWindow):
 
             self.scoreboard.set_players(self.state.players["BLACK"]["name"], self.state.players["WHITE"]["name"])
 
+            # Only the final position is applied; apply_snapshot refreshes the controls
             if self.state.timeline:
                 self.state.game_started = True
                 self.apply_snapshot(len(self.state.timeline) - 1)
+            else:
+                self.update_ui_state()
 
             self.log("System: Game loaded successfully")
-            self.update_ui_state()
         except Exception as e:
             self.log(f"Error loading game: {e}")
 
@@ -335,34 +361,34 @@ class ReversiApp(QMainWindow):
         board_str = snapshot["board"]
         turn = snapshot["current_player"]
 
-        self.send_command(f"{Command.BOARD} {self.state.board_size} {turn} {board_str}")
+        # Replay browsing renders from the stored strings alone; the engine only needs
+        # the position when play continues from it (loading a save)
+        if self.state.game_started:
+            self.send_command(f"{Command.BOARD} {self.state.board_size} {turn} {board_str}")
         self.state.current_turn = turn
-        self.update_board_ui(self.state.board_size, board_str)
+        # Snapshots already carry their disc counts; older saves may not
+        scores = snapshot.get("scores") or {}
+        self.update_board_ui(self.state.board_size, board_str, scores.get("BLACK"), scores.get("WHITE"))
         player = self.state.players[turn]
         self.scoreboard.set_status(turn, player["name"], player["is_human"])
         self.update_ui_state()
 
-    def update_board_ui(self, size, state_str):
-        state = {}
-        idx = 0
-        black_count = 0
-        white_count = 0
-        for r in range(size):
-            for c in range(size):
-                char = state_str[idx]
-                coord = f"{chr(65+c)}{r+1}"
-                if char == 'B':
-                    state[coord] = "BLACK"
-                    black_count += 1
-                elif char == 'W':
-                    state[coord] = "WHITE"
-                    white_count += 1
-                idx += 1
-
-        self.board_widget.set_state(state)
+    def update_board_ui(self, size, state_str, black_count=None, white_count=None):
+        # Validate the length once so the board can walk the string without bounds checks
+        expected = size * size
+        if len(state_str) < expected:
+            self.log(f"ERROR: Malformed board state ({len(state_str)} of {expected} cells)")
+            return False
+        state_str = state_str[:expected]
+
+        self.board_widget.set_board(state_str)
+        if black_count is None or white_count is None:
+            black_count = state_str.count("B")
+            white_count = state_str.count("W")
         self.state.score_black = black_count
         self.state.score_white = white_count
         self.scoreboard.update_scores(black_count, white_count)
+        return True
 
     def handle_board_click(self, coord):
         if not self.state.game_started or not self.state.players[self.state.current_turn]["is_human"]:
@@ -426,9 +452,7 @@ class ReversiApp(QMainWindow):
 
     def start_new_game(self):
         self.state.reset(self.state.board_size)
-        self.board_widget.set_state({})
-        self.board_widget.set_valid_moves([])
-        self.board_widget.set_analysis({})
+        self.board_widget.reset()
 
         self.send_command(f"{Command.INIT} {self.state.board_size}")
         self.send_command(Command.NEWGAME)
@@ -449,10 +473,16 @@ class ReversiApp(QMainWindow):
         if is_human_vs_ai and self.state.players[self.state.current_turn]["is_human"]:
             undo_count = 2
 
+        # The first timeline entry is the opening position, which the engine cannot undo;
+        # asking for more would swallow the only BOARD update the engine sends back
+        timeline = self.state.timeline
+        undo_count = min(undo_count, len(timeline) - 1)
+        if undo_count <= 0:
+            self.log("System: Nothing to undo.")
+            return
+
         self.state.undo_expect_updates = undo_count
-        for _ in range(undo_count):
-            if self.state.timeline:
-                self.state.timeline.pop()
+        del timeline[len(timeline) - undo_count:]
 
         for _ in range(undo_count):
             self.send_command(Command.UNDO)
@@ -462,6 +492,12 @@ class ReversiApp(QMainWindow):
         self.board_widget.set_analysis({})
 
     def update_ui_state(self):
+        if not self._ui_state_pending:
+            self._ui_state_pending = True
+            QTimer.singleShot(0, self._refresh_ui_state)
+
+    def _refresh_ui_state(self):
+        self._ui_state_pending = False
         is_human_turn = self.state.players.get(self.state.current_turn, {}).get("is_human", False)
         has_moves = len(self.state.timeline) > 0
         is_undoing = self.state.undo_expect_updates > 0
@@ -1,6 +1,55 @@
+import math
+
 from PySide6.QtWidgets import QWidget, QSizePolicy
-from PySide6.QtCore import Qt, Signal, QRectF, QPointF
-from PySide6.QtGui import QPainter, QColor, QRadialGradient, QBrush, QPen, QFont
+from PySide6.QtCore import Qt, Signal, QRectF, QPointF, QPoint, QSize, QTimer
+from PySide6.QtGui import QPainter, QColor, QGradient, QRadialGradient, QBrush, QPen, QFont, QPixmap, QRegion
+
+_CELL_COLOR_LIGHT = QColor("#1B5E20")
+_CELL_COLOR_DARK = QColor("#215732")
+_PIECE_SHADOW = QColor(0, 0, 0, 150)
+_BOARD_BASE_COLOR = QColor("#0d3011")  # Deep green base
+_BOARD_EDGE_PEN = QPen(QColor(255, 255, 255, 30), 2)
+_CELL_EDGE_PEN = QPen(QColor(0, 0, 0, 40), 1)
+_SCORE_SHADOW_COLOR = QColor(0, 0, 0, 180)
+_SCORE_TEXT_COLOR = QColor(222, 222, 222, 220)
+_CHAR_TO_COLOR = {"B": "BLACK", "W": "WHITE"}
+# Quiet period after the last resize before the static board layer is re-rendered
+_BACKGROUND_REBUILD_DELAY_MS = 150
+# How far the soft outer shadow reaches beyond the board edge
+_BOARD_SHADOW_SPREAD = 15
+
+
+def _piece_style(inner: str, outer: str, edge: str, edge_width: float):
+    # Gradient is expressed relative to the piece rect so one brush serves every cell
+    grad = QRadialGradient(QPointF(0.5, 0.5), 1.0)
+    grad.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+    grad.setColorAt(0, QColor(inner))
+    grad.setColorAt(1, QColor(outer))
+    return QBrush(grad), QPen(QColor(edge), edge_width)
+
+
+def _marker_brush():
+    # Relative to the marker's bounding square, like the piece gradients
+    glow = QRadialGradient(QPointF(0.5, 0.5), 0.5)
+    glow.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+    # Large central area with deep charcoal/grey
+    glow.setColorAt(0, QColor(0, 0, 0, 200))
+    # Transition to a dark forest green that matches board tones
+    glow.setColorAt(0.8, QColor(33, 87, 50, 150))
+    # Keep the edge sharp but slightly feathered for blending
+    glow.setColorAt(0.9, QColor(33, 87, 50, 100))
+    glow.setColorAt(1.0, QColor(33, 87, 50, 50))
+    return QBrush(glow)
+
+
+_MARKER_BRUSH = _marker_brush()
+
+_PIECE_STYLES = {
+    # Soft grey-black with very subtle gradient
+    "BLACK": _piece_style("#444444", "#2a2a2a", "#1a1a1a", 1.0),
+    # Soft off-white with very subtle gradient
+    "WHITE": _piece_style("#f5f5f5", "#e0e0e0", "#cccccc", 1.5),
+}
 
 class BoardWidget(QWidget):
     clicked = Signal(str)  # Emits coordinate like "D4"
@@ -10,29 +59,159 @@ class BoardWidget(QWidget):
         self.board_size = board_size
         self.cell_size = 60
         self.board_padding = 20  # Space between grid and board edge
-        self.board_state = {}  # coord -> color ("BLACK", "WHITE")
-        self.valid_moves = set()
-        self.analysis_scores = {} # coord -> score string
+        # Per-cell data lives in flat lists indexed by r * board_size + c
+        cell_count = board_size * board_size
+        self._coords = tuple(f"{chr(65+c)}{r+1}" for r in range(board_size) for c in range(board_size))
+        self._coord_index = {coord: idx for idx, coord in enumerate(self._coords)}
+        # Pre-built blank layers so a reset is a plain reference swap
+        self._empty_pieces = (None,) * cell_count
+        self._empty_markers = (False,) * cell_count
+        self._empty_scores = (None,) * cell_count
+        self._pieces = self._empty_pieces    # idx -> "BLACK" / "WHITE" / None
+        self._markers = self._empty_markers  # idx -> valid move marker
+        self._scores = self._empty_scores    # idx -> analysis score string
+        self._valid_moves = frozenset()
+        self._board_str = None  # Last BOARD string applied, used to repaint only changed cells
+        # Board geometry is recomputed only when the widget is resized
+        self._board_rect = QRectF()
+        self._cells = []  # idx -> (cell rect, base color)
+        self._score_font = QFont("Arial")
+        self._score_font.setBold(True)
+        # Cached render of the static layer (shadow, board base, cell grid).
+        # Rebuilt on the trailing edge of a resize burst; painted live until then.
+        # The layer only covers the board and its shadow, so it is reused as long
+        # as the board keeps its size and sub-pixel alignment within the widget.
+        self._background = None
+        self._background_key = None
+        self._background_origin = QPoint()
+        self._background_timer = QTimer(self)
+        self._background_timer.setSingleShot(True)
+        self._background_timer.setInterval(_BACKGROUND_REBUILD_DELAY_MS)
+        self._background_timer.timeout.connect(self._rebuild_background)
         self.setMouseTracking(True)
         # Allow control to fill available space
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
-    def set_state(self, state: dict):
-        self.board_state = state
+    def reset(self):
+        self._pieces = self._empty_pieces
+        self._board_str = None
+        self._markers = self._empty_markers
+        self._valid_moves = frozenset()
+        self._scores = self._empty_scores
         self.update()
 
+    def set_board(self, state_str: str):
+        # state_str uses the protocol's BOARD encoding: one 'B' / 'W' / '.' per cell
+        previous = self._board_str
+        if state_str == previous:
+            return
+        self._board_str = state_str
+        # map() drives the lookup from C instead of a Python-level comprehension
+        self._pieces = list(map(_CHAR_TO_COLOR.get, state_str))
+        if previous is None or len(previous) != len(state_str) or not self._cells:
+            self.update()
+            return
+        # A move flips only a handful of discs; repaint just those cells
+        cells = self._cells
+        for idx, (old, new) in enumerate(zip(previous, state_str)):
+            if old != new:
+                self.update(cells[idx][0].toAlignedRect())
+
     def set_valid_moves(self, moves: list):
-        self.valid_moves = set(moves)
-        self.update()
+        move_set = frozenset(moves)
+        if move_set == self._valid_moves:
+            return
+        changed = move_set ^ self._valid_moves
+        self._valid_moves = move_set
+        if move_set:
+            markers = [False] * len(self._coords)
+            for coord in move_set:
+                idx = self._coord_index.get(coord)
+                if idx is not None:
+                    markers[idx] = True
+            self._markers = markers
+        else:
+            self._markers = self._empty_markers
+        if not self._cells:
+            self.update()
+            return
+        # Only cells that gained or lost a marker need repainting
+        for coord in changed:
+            idx = self._coord_index.get(coord)
+            if idx is not None:
+                self.update(self._cells[idx][0].toAlignedRect())
 
     def set_analysis(self, scores: dict):
-        self.analysis_scores = scores
+        if not scores:
+            if self._scores is not self._empty_scores:
+                self._scores = self._empty_scores
+                self.update()
+            return
+        cell_scores = [None] * len(self._coords)
+        for coord, score in scores.items():
+            idx = self._coord_index.get(coord)
+            if idx is not None:
+                cell_scores[idx] = score
+        self._scores = cell_scores
         self.update()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        self._update_geometry()
+        if self._background is not None and self._background_key == self._get_background_key():
+            # Only the board position changed; the cached layer is still valid
+            self._background_origin = self._get_background_origin()
+        else:
+            self._background = None
+            self._background_timer.start()
+        self.update()
+
+    def _get_background_key(self):
+        rect = self._board_rect
+        return (rect.width(), rect.height(), rect.left() % 1, rect.top() % 1, self.devicePixelRatioF())
+
+    def _get_background_origin(self):
+        margin = _BOARD_SHADOW_SPREAD + 1
+        return QPoint(math.floor(self._board_rect.left()) - margin, math.floor(self._board_rect.top()) - margin)
+
+    def _rebuild_background(self):
+        key = self._get_background_key()
+        if self._background is not None and self._background_key == key:
+            return
+        origin = self._get_background_origin()
+        extent = self._board_rect.adjusted(-origin.x(), -origin.y(), -origin.x(), -origin.y())
+        size = QSize(math.ceil(extent.right()) + _BOARD_SHADOW_SPREAD + 1,
+                     math.ceil(extent.bottom()) + _BOARD_SHADOW_SPREAD + 1)
+        ratio = key[-1]
+        pixmap = QPixmap(size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.translate(-origin.x(), -origin.y())
+        self._paint_background(painter)
+        painter.end()
+        self._background = pixmap
+        self._background_key = key
+        self._background_origin = origin
         self.update()
 
+    def _update_geometry(self):
+        self._board_rect, self.cell_size = self._get_board_rect()
+
+        grid_origin_x = self._board_rect.left() + self.board_padding
+        grid_origin_y = self._board_rect.top() + self.board_padding
+        cells = []
+        for r in range(self.board_size):
+            for c in range(self.board_size):
+                x = grid_origin_x + c * self.cell_size
+                y = grid_origin_y + r * self.cell_size
+                base_color = _CELL_COLOR_LIGHT if (r + c) % 2 == 0 else _CELL_COLOR_DARK
+                cells.append((QRectF(x, y, self.cell_size, self.cell_size), base_color))
+        self._cells = cells
+        # Larger font size for better visibility
+        self._score_font.setPointSize(max(8, int(self.cell_size * 0.22)))
+
     def _get_board_rect(self):
         # Calculate board rect centered in the widget
         width = self.width()
@@ -51,54 +230,67 @@ class BoardWidget(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        board_rect, self.cell_size = self._get_board_rect()
+        # A screen change can alter the device pixel ratio without a resize; never blit a
+        # layer rendered for another ratio, paint live until it is rebuilt instead
+        if self._background is not None and self._background_key != self._get_background_key():
+            self._background = None
+            self._background_timer.start()
+
+        if self._background is not None:
+            painter.drawPixmap(self._background_origin, self._background)
+        else:
+            self._paint_background(painter)
+
+        # 3. Draw the dynamic layer on top of each cell
+        pieces = self._pieces
+        markers = self._markers
+        scores = self._scores
+        # Partial repaints (e.g. a few flipped discs) only redraw cells in the dirty region
+        dirty = event.region()
+        # QRegion.contains(QRect) only tests overlap, so check that nothing is left uncovered
+        full_repaint = QRegion(self.rect()).subtracted(dirty).isEmpty()
+        for idx, (rect, _) in enumerate(self._cells):
+            if not full_repaint and not dirty.intersects(rect.toAlignedRect()):
+                continue
+            # Draw pieces
+            color = pieces[idx]
+            if color:
+                self._draw_piece(painter, rect, color)
+
+            # Draw valid move markers (The Glow)
+            if markers[idx]:
+                self._draw_marker(painter, rect)
+
+            # Draw analysis scores
+            score = scores[idx]
+            if score is not None:
+                self._draw_analysis(painter, rect, score)
+
+    def _paint_background(self, painter):
+        board_rect = self._board_rect
 
         # 1. Draw outer background (The "Stage")
         painter.save()
         # Draw a large soft outer shadow
-        for i in range(15, 0, -1):
-            alpha = int(30 * (1 - i/15))
+        for i in range(_BOARD_SHADOW_SPREAD, 0, -1):
+            alpha = int(30 * (1 - i/_BOARD_SHADOW_SPREAD))
             painter.setPen(Qt.PenStyle.NoPen)
             painter.setBrush(QColor(0, 0, 0, alpha))
             painter.drawRoundedRect(board_rect.adjusted(-i, -i, i, i), 20, 20)
 
         # Draw board base
-        painter.setBrush(QColor("#0d3011")) # Deep green base
-        painter.setPen(QPen(QColor(255, 255, 255, 30), 2))
+        painter.setBrush(_BOARD_BASE_COLOR)
+        painter.setPen(_BOARD_EDGE_PEN)
         painter.drawRoundedRect(board_rect, 12, 12)
         painter.restore()
 
-        # 2. Draw each cell (Offset by board_padding)
-        grid_origin_x = board_rect.left() + self.board_padding
-        grid_origin_y = board_rect.top() + self.board_padding
-
-        for r in range(self.board_size):
-            for c in range(self.board_size):
-                x = grid_origin_x + c * self.cell_size
-                y = grid_origin_y + r * self.cell_size
-                rect = QRectF(x, y, self.cell_size, self.cell_size)
-
-                coord = f"{chr(65+c)}{r+1}"
-
-                # Draw cell background
-                painter.save()
-                base_color = QColor("#1B5E20") if (r + c) % 2 == 0 else QColor("#215732")
-                painter.setBrush(base_color)
-                painter.setPen(QPen(QColor(0, 0, 0, 40), 1))
-                painter.drawRect(rect)
-                painter.restore()
-
-                # Draw pieces
-                if coord in self.board_state:
-                    self._draw_piece(painter, rect, self.board_state[coord])
-
-                # Draw valid move markers (The Glow)
-                if coord in self.valid_moves:
-                    self._draw_marker(painter, rect)
-
-                # Draw analysis scores
-                if coord in self.analysis_scores:
-                    self._draw_analysis(painter, rect, self.analysis_scores[coord])
+        # 2. Draw each cell background (Offset by board_padding)
+        for rect, base_color in self._cells:
+            painter.save()
+            painter.setBrush(base_color)
+            painter.setPen(_CELL_EDGE_PEN)
+            painter.drawRect(rect)
+            painter.restore()
 
     def _draw_piece(self, painter, rect, color):
         painter.save()
@@ -109,23 +301,12 @@ class BoardWidget(QWidget):
         offset = self.cell_size * 0.04
         shadow_rect = piece_rect.translated(offset, offset)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(0, 0, 0, 150))
+        painter.setBrush(_PIECE_SHADOW)
         painter.drawEllipse(shadow_rect)
 
-        if color == "BLACK":
-            # Soft grey-black with very subtle gradient
-            grad = QRadialGradient(piece_rect.center(), piece_rect.width())
-            grad.setColorAt(0, QColor("#444444"))
-            grad.setColorAt(1, QColor("#2a2a2a"))
-            painter.setBrush(grad)
-            painter.setPen(QPen(QColor("#1a1a1a"), 1.0))
-        else:
-            # Soft off-white with very subtle gradient
-            grad = QRadialGradient(piece_rect.center(), piece_rect.width())
-            grad.setColorAt(0, QColor("#f5f5f5"))
-            grad.setColorAt(1, QColor("#e0e0e0"))
-            painter.setBrush(grad)
-            painter.setPen(QPen(QColor("#cccccc"), 1.5))
+        brush, pen = _PIECE_STYLES[color]
+        painter.setBrush(brush)
+        painter.setPen(pen)
 
         painter.drawEllipse(piece_rect)
         painter.restore()
@@ -136,41 +317,28 @@ class BoardWidget(QWidget):
         radius = self.cell_size * 0.45
         center = rect.center()
 
-        glow = QRadialGradient(center, radius)
-        # Large central area with deep charcoal/grey
-        glow.setColorAt(0, QColor(0, 0, 0, 200))
-        # Transition to a dark forest green that matches board tones
-        glow.setColorAt(0.8, QColor(33, 87, 50, 150))
-        # Keep the edge sharp but slightly feathered for blending
-        glow.setColorAt(0.9, QColor(33, 87, 50, 100))
-        glow.setColorAt(1.0, QColor(33, 87, 50, 50))
-
-        painter.setBrush(glow)
+        painter.setBrush(_MARKER_BRUSH)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(center, radius, radius)
         painter.restore()
 
     def _draw_analysis(self, painter, rect, score):
         painter.save()
-        # Larger font size for better visibility
-        font_size = max(8, int(self.cell_size * 0.22))
-        font = QFont("Arial", font_size)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setFont(self._score_font)
 
         score_text = str(score)
 
         # Enhanced shadow for the larger text
-        painter.setPen(QColor(0, 0, 0, 180))
+        painter.setPen(_SCORE_SHADOW_COLOR)
         painter.drawText(rect.adjusted(1, 1, 1, 1), Qt.AlignmentFlag.AlignCenter, score_text)
 
         # Center-aligned bright foreground
-        painter.setPen(QColor(222, 222, 222, 220))
+        painter.setPen(_SCORE_TEXT_COLOR)
         painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, score_text)
         painter.restore()
 
     def mousePressEvent(self, event):
-        board_rect, _ = self._get_board_rect()
+        board_rect = self._board_rect
         grid_origin_x = board_rect.left() + self.board_padding
         grid_origin_y = board_rect.top() + self.board_padding
 
@@ -182,5 +350,4 @@ class BoardWidget(QWidget):
             c = int(rel_x / self.cell_size)
             r = int(rel_y / self.cell_size)
             if 0 <= r < self.board_size and 0 <= c < self.board_size:
-                coord = f"{chr(65+c)}{r+1}"
-                self.clicked.emit(coord)
+                self.clicked.emit(self._coords[r * self.board_size + c])
@@ -24,6 +24,7 @@ class EngineConfigDialog(QDialog):
         self.color = "BLACK"
         self.is_human_mode = False
         self.current_config = {}
+        self._engine_list_mode = None  # is_human value the engine combo was last filled for
 
         self._setup_ui()
 
@@ -71,6 +72,8 @@ class EngineConfigDialog(QDialog):
         layout.addWidget(self.params_group)
 
         self.param_controls = {}
+        self._param_fields = []  # (name, bound value accessor), resolved when the form is built
+        self._form_key = None  # (engine_key, is_human_mode) the form was built for
 
         # 5. Buttons
         btn_layout = QHBoxLayout()
@@ -107,16 +110,20 @@ class EngineConfigDialog(QDialog):
             self.params_group.setVisible(True)
             self.engine_group.setVisible(True)
 
-        # Filter engines
-        all_meta = list_engine_metadata()
-        if is_human:
-            available = [m for m in all_meta if m.supports_analysis]
-        else:
-            available = all_meta
-
-        self.engine_combo.clear()
-        for meta in available:
-            self.engine_combo.addItem(meta.label, meta.key)
+        # Repopulate silently; the form is rebuilt once below for the final selection
+        self.engine_combo.blockSignals(True)
+        # The engine list only depends on the mode, so the combo is refilled when that changes
+        if self._engine_list_mode != is_human:
+            all_meta = list_engine_metadata()
+            if is_human:
+                available = [m for m in all_meta if m.supports_analysis]
+            else:
+                available = all_meta
+
+            self.engine_combo.clear()
+            for meta in available:
+                self.engine_combo.addItem(meta.label, meta.key)
+            self._engine_list_mode = is_human
 
         # Select current engine
         current_key = resolve_engine_key(config.get("key") or config.get("engine_key") or "minimax")
@@ -125,6 +132,7 @@ class EngineConfigDialog(QDialog):
             self.engine_combo.setCurrentIndex(idx)
         else:
             self.engine_combo.setCurrentIndex(0)
+        self.engine_combo.blockSignals(False)
 
         self._refresh_params()
         self.adjustSize()
@@ -139,14 +147,31 @@ class EngineConfigDialog(QDialog):
         self._refresh_params()
 
     def _refresh_params(self):
+        engine_key = self.engine_combo.currentData()
+        # Same engine and mode as the form on screen: only the values need resetting
+        if engine_key and (engine_key, self.is_human_mode) == self._form_key:
+            self._reset_param_values(engine_key)
+            return
+
+        # Suspend repaints while rows are swapped so the group is painted once, fully rebuilt
+        self.params_group.setUpdatesEnabled(False)
+        try:
+            self._rebuild_params()
+        finally:
+            self.params_group.setUpdatesEnabled(True)
+
+    def _rebuild_params(self):
         # Clear existing form
         while self.params_form.rowCount() > 0:
             self.params_form.removeRow(0)
         self.param_controls = {}
+        self._param_fields = []
+        self._form_key = None
 
         engine_key = self.engine_combo.currentData()
         if not engine_key:
             return
+        self._form_key = (engine_key, self.is_human_mode)
 
         meta = get_engine_metadata(engine_key)
         self.description_text.setText(meta.description)
@@ -160,8 +185,7 @@ class EngineConfigDialog(QDialog):
                 continue
 
             control = self._create_param_control(p, params.get(p.name, p.default))
-            self.param_controls[p.name] = control
-            self.params_form.addRow(p.label + ":", control)
+            self._add_param_row(p.name, p.label + ":", control)
 
         # Add Think Delay if not in analysis mode
         if not self.is_human_mode:
@@ -170,8 +194,45 @@ class EngineConfigDialog(QDialog):
             delay_spin.setRange(0.0, 5.0)
             delay_spin.setSingleStep(0.05)
             delay_spin.setValue(delay)
-            self.param_controls["think_delay"] = delay_spin
-            self.params_form.addRow("Think Delay (s):", delay_spin)
+            self._add_param_row("think_delay", "Think Delay (s):", delay_spin)
+
+    def _reset_param_values(self, engine_key: str):
+        meta = get_engine_metadata(engine_key)
+        params = self.current_config.get("params", {})
+        for p in meta.parameters:
+            control = self.param_controls.get(p.name)
+            if control is not None:
+                self._set_control_value(control, params.get(p.name, p.default))
+
+        delay_spin = self.param_controls.get("think_delay")
+        if delay_spin is not None:
+            delay_spin.setValue(params.get("think_delay", meta.default_think_delay))
+
+    @staticmethod
+    def _set_control_value(control, value: Any):
+        if isinstance(control, QSpinBox):
+            control.setValue(int(value))
+        elif isinstance(control, QDoubleSpinBox):
+            control.setValue(float(value))
+        elif isinstance(control, QComboBox):
+            control.setCurrentIndex(max(control.findData(str(value)), 0))
+        else:
+            control.setText(str(value))
+
+    def _add_param_row(self, name: str, label: str, control):
+        self.param_controls[name] = control
+        getter = self._value_getter(control)
+        if getter is not None:
+            self._param_fields.append((name, getter))
+        self.params_form.addRow(label, control)
+
+    @staticmethod
+    def _value_getter(control):
+        if isinstance(control, (QSpinBox, QDoubleSpinBox)):
+            return control.value
+        if isinstance(control, QComboBox):
+            return control.currentData
+        return None  # Read-only fallback controls carry no value
 
     def _create_param_control(self, meta: EngineParamMetadata, current_val: Any):
         control = None
@@ -202,14 +263,7 @@ class EngineConfigDialog(QDialog):
         return control
 
     def get_config(self) -> Dict[str, Any]:
-        params = {}
-        for name, ctrl in self.param_controls.items():
-            if isinstance(ctrl, QSpinBox):
-                params[name] = ctrl.value()
-            elif isinstance(ctrl, QDoubleSpinBox):
-                params[name] = ctrl.value()
-            elif isinstance(ctrl, QComboBox):
-                params[name] = ctrl.currentData()
+        params = {name: getter() for name, getter in self._param_fields}
 
         config = {
             "key": self.engine_combo.currentData(),
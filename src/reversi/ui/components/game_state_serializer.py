@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List
 
@@ -14,7 +13,7 @@ TimelineEntry = Dict[str, Any]
 EngineSettings = Dict[str, JSONDict]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameStateSnapshot:
     board_size: int
     human_color: str
@@ -25,7 +24,7 @@ class GameStateSnapshot:
     timeline: List[TimelineEntry]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoadedGameState:
     timeline: List[TimelineEntry]
     player_modes: Dict[str, str]
@@ -42,7 +41,7 @@ def serialize(snapshot: GameStateSnapshot) -> JSONDict:
         "player_modes": dict(snapshot.player_modes),
         "ai_engine_settings": _clone_engine_settings(snapshot.ai_engine_settings),
         "analysis_settings": _clone_engine_settings(snapshot.analysis_settings),
-        "timeline": copy.deepcopy(snapshot.timeline),
+        "timeline": _clone_timeline(snapshot.timeline),
     }
 
 
@@ -90,13 +89,16 @@ def _normalize_timeline(raw_timeline: Any) -> List[TimelineEntry]:
     for idx, entry in enumerate(raw_timeline):
         entry_data = entry if isinstance(entry, dict) else {}
         move = entry_data.get("move")
+        scores = entry_data.get("scores")
+        # Nested dicts come straight from the parsed file and are owned by the
+        # new timeline, so they are reused rather than copied per entry
         normalized.append(
             {
                 "index": entry_data.get("index", idx),
                 "board": entry_data.get("board", ""),
                 "current_player": entry_data.get("current_player", "BLACK"),
-                "move": dict(move) if isinstance(move, dict) else None,
-                "scores": dict(entry_data.get("scores", {})),
+                "move": move if isinstance(move, dict) else None,
+                "scores": scores if isinstance(scores, dict) else {},
             }
         )
     return normalized
@@ -105,9 +107,11 @@ def _normalize_timeline(raw_timeline: Any) -> List[TimelineEntry]:
 def _extract_player_modes(data: JSONDict) -> Dict[str, str]:
     raw_modes = data.get("player_modes")
     if isinstance(raw_modes, dict):
-        merged = _DEFAULT_PLAYER_MODES.copy()
-        merged.update({k: v for k, v in raw_modes.items() if k in merged and v in ("human", "engine")})
-        return merged
+        # Validate and merge over the defaults in a single pass
+        return {
+            color: mode if (mode := raw_modes.get(color)) in ("human", "engine") else default
+            for color, default in _DEFAULT_PLAYER_MODES.items()
+        }
 
     fallback_human = data.get("human_color", "BLACK")
     fallback_ai = data.get("ai_color", "WHITE")
@@ -136,5 +140,26 @@ def _merge_engine_settings(
     return result
 
 
+def _clone_timeline(timeline: List[TimelineEntry]) -> List[TimelineEntry]:
+    # Entries hold scalars plus flat move/scores dicts, so copying one level
+    # down detaches them without deepcopy's per-object memo bookkeeping
+    return [
+        {key: dict(value) if isinstance(value, dict) else value for key, value in entry.items()}
+        for entry in timeline
+    ]
+
+
 def _clone_engine_settings(settings: EngineSettings) -> JSONDict:
-    return {k: copy.deepcopy(v) for k, v in settings.items()}
+    # Each entry is {"key", "params", ...} with scalar params, so two shallow
+    # copies detach it as fully as deepcopy did
+    return {k: _clone_engine_config(v) for k, v in settings.items()}
+
+
+def _clone_engine_config(config: Any) -> Any:
+    if not isinstance(config, dict):
+        return config
+    cloned = dict(config)
+    params = cloned.get("params")
+    if isinstance(params, dict):
+        cloned["params"] = dict(params)
+    return cloned
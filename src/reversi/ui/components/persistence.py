@@ -39,8 +39,10 @@ class PersistenceManager:
             try:
                 # Store the directory part of the path
                 self.settings.setValue("last_dir", os.path.dirname(file_path))
+                # Encode in memory and write once; json.dump issues a write per token
+                text = json.dumps(payload, indent=2)
                 with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(payload, f, indent=2)
+                    f.write(text)
                 self.log(f"Saved game to {file_path}")
             except Exception as e:
                 self.log(f"Error saving game: {e}")
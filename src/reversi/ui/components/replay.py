@@ -1,7 +1,8 @@
-import asyncio
 from typing import Callable
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QPushButton, QLabel, QStyle
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
+
+_AUTOPLAY_INTERVAL_MS = 800
 
 class ReplayController(QWidget):
     def __init__(self,
@@ -15,7 +16,11 @@ class ReplayController(QWidget):
 
         self.replay_index = 0
         self.replay_playing = False
-        self._replay_task: asyncio.Task | None = None
+        self._status_key = None
+        # Autoplay steps are driven by a repeating Qt timer (monotonic clock, no task per step)
+        self._autoplay_timer = QTimer(self)
+        self._autoplay_timer.setInterval(_AUTOPLAY_INTERVAL_MS)
+        self._autoplay_timer.timeout.connect(self._autoplay_step)
 
         self._setup_ui()
 
@@ -78,13 +83,19 @@ class ReplayController(QWidget):
         total = self.get_timeline_len()
         max_index = max(total - 1, 0)
 
-        self.status_label.setText(f"Replay {self.replay_index} / {max_index}" if total else "Replay 0 / 0")
-
         active_game = self.is_game_started()
         # Per user request: Unfinished games cannot be browsed (Replay toolbar disabled)
         # Note: We consider a game "finished" if game_started is False after some moves.
         toolbar_disabled = active_game or total == 0
 
+        # Autoplay refreshes the toolbar every step; skip the widget calls when nothing changed
+        key = (self.replay_index, total, toolbar_disabled, self.replay_playing)
+        if key == self._status_key:
+            return
+        self._status_key = key
+
+        self.status_label.setText(f"Replay {self.replay_index} / {max_index}" if total else "Replay 0 / 0")
+
         at_start = self.replay_index <= 0
         at_end = self.replay_index >= max_index
 
@@ -128,28 +139,16 @@ class ReplayController(QWidget):
         if self.replay_playing: return
         self.replay_playing = True
         self.update_status()
-        self._replay_task = asyncio.create_task(self._autoplay_loop())
+        self._autoplay_timer.start()
 
     def stop_autoplay(self):
         self.replay_playing = False
-        if self._replay_task:
-            self._replay_task.cancel()
-            self._replay_task = None
+        self._autoplay_timer.stop()
         self.update_status()
 
-    async def _autoplay_loop(self):
-        try:
-            while self.replay_playing:
-                await asyncio.sleep(0.8)
-                total = self.get_timeline_len()
-                if self.replay_index < total - 1:
-                    idx = self.replay_index + 1
-                    self.apply_snapshot(idx)
-                else:
-                    self.replay_playing = False
-                    break
-        except asyncio.CancelledError:
-            pass
-        finally:
-            self.replay_playing = False
-            self.update_status()
+    def _autoplay_step(self):
+        total = self.get_timeline_len()
+        if self.replay_index < total - 1:
+            self.apply_snapshot(self.replay_index + 1)
+        else:
+            self.stop_autoplay()
@@ -1,6 +1,8 @@
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel
 from PySide6.QtCore import Qt
 
+_COLOR_NAMES = {"BLACK": "Black", "WHITE": "White"}
+
 class ScoreboardWidget(QWidget):
     def __init__(self):
         super().__init__()
@@ -38,18 +40,30 @@ class ScoreboardWidget(QWidget):
         main_layout.addLayout(row1)
         main_layout.addLayout(row2)
 
+        self._scores = (2, 2)
+        self._status_key = None  # (turn_color, player_name) currently shown, if any
+        self._player_names = None
+
     def update_scores(self, black, white):
+        if (black, white) == self._scores:
+            return
+        self._scores = (black, white)
         self.label_score.setText(f"{black} : {white}")
 
     def set_status(self, turn_color, player_name, is_human):
-        role = "Human" if is_human else "AI"
-        color_name = "Black" if turn_color == "BLACK" else "White"
-        text = f"{color_name} ({player_name}) to move"
-        self.label_status.setText(text)
+        if (turn_color, player_name) == self._status_key:
+            return
+        self._status_key = (turn_color, player_name)
+        color_name = _COLOR_NAMES.get(turn_color, "White")
+        self.label_status.setText(f"{color_name} ({player_name}) to move")
 
     def set_status_text(self, text):
+        self._status_key = None
         self.label_status.setText(text)
 
     def set_players(self, black_name, white_name):
+        if (black_name, white_name) == self._player_names:
+            return
+        self._player_names = (black_name, white_name)
         self.label_black_player.setText(f"{black_name} ●")
         self.label_white_player.setText(f"○ {white_name}")
@@ -1,3 +1,4 @@
+from collections import deque
 from PySide6.QtCore import QObject, Signal, Slot, Qt
 from reversi.protocol.interface import EngineInterface
 from reversi.protocol.constants import Command, Response
@@ -14,65 +15,98 @@ class EngineBroker(QObject):
     analysis_received = Signal(dict)
     scores_received = Signal(int, int) # black (or -1), white (or -1)
     game_over = Signal(str) # winner
-    raw_message_received = Signal(str)
+    messages_pending = Signal()
 
     def __init__(self, engine: EngineInterface):
         super().__init__()
         self.engine = engine
         self.engine.set_callback(self.on_raw_message)
-        # Use QueuedConnection to ensure that engine responses are processed in the 
-        # next event loop tick, preventing blocking the UI thread during a command chain.
-        self.raw_message_received.connect(self.process_response, Qt.ConnectionType.QueuedConnection)
+        # Engine callbacks may arrive on worker threads in bursts. Messages are queued
+        # here and drained in the next event loop tick, so a burst costs one queued
+        # signal instead of one per line and never blocks the UI during a command chain.
+        self._pending = deque()
+        self._drain_scheduled = False
+        self.messages_pending.connect(self._drain_pending, Qt.ConnectionType.QueuedConnection)
+
+        # Dispatch table keyed by response token; each handler parses only its own payload
+        self._handlers = {
+            Response.MOVE: self._on_logged,
+            Response.PASS: self._on_logged,
+            Response.READY: self._on_logged,
+            Response.ERROR: self._on_error,
+            Response.BOARD: self._on_board,
+            Response.VALID_MOVES: self._on_valid_moves,
+            Response.ANALYSIS: self._on_analysis,
+            Response.INFO: self._on_info,
+            Response.RESULT: self._on_result,
+        }
 
     def on_raw_message(self, message: str):
-        self.raw_message_received.emit(message)
+        self._pending.append(message)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.messages_pending.emit()
+
+    @Slot()
+    def _drain_pending(self):
+        # Clear the flag before draining so messages arriving meanwhile schedule another pass
+        self._drain_scheduled = False
+        pending = self._pending
+        while pending:
+            message = pending.popleft()
+            # Back-to-back ANALYSIS results supersede each other; only the newest is shown
+            if pending and message.startswith(Response.ANALYSIS) and pending[0].startswith(Response.ANALYSIS):
+                continue
+            self.process_response(message)
 
     @Slot(str)
     def process_response(self, message: str):
-        parts = message.split()
-        if not parts: return
-        cmd = parts[0]
+        message = message.strip()
+        cmd, _, payload = message.partition(" ")
+        handler = self._handlers.get(cmd)
+        if handler:
+            handler(message, payload)
+
+    def _on_logged(self, message: str, payload: str):
+        self.message_logged.emit(f"Engine: {message}")
+
+    def _on_error(self, message: str, payload: str):
+        self.error_occurred.emit(message)
 
-        # 1. Logging Logic
-        if cmd in (Response.MOVE, Response.PASS, Response.READY, Response.RESULT):
+    def _on_board(self, message: str, payload: str):
+        fields = payload.split(maxsplit=3)
+        if len(fields) >= 3:
+            self.board_received.emit(int(fields[0]), fields[1], fields[2])
+
+    def _on_valid_moves(self, message: str, payload: str):
+        self.valid_moves_received.emit(payload.split())
+
+    def _on_analysis(self, message: str, payload: str):
+        items = payload.split()
+        self.message_logged.emit(f"Engine: ANALYSIS received ({len(items)} scores)")
+        scores = {}
+        for item in items:
+            coord, sep, score = item.partition(":")
+            if sep:
+                scores[coord] = score
+        self.analysis_received.emit(scores)
+
+    def _on_info(self, message: str, payload: str):
+        # Only the key and its first value are used; leave any trailing text unsplit
+        fields = payload.split(maxsplit=2)
+        key = fields[0] if fields else ""
+        if key == "SCORE_BLACK" and len(fields) >= 2:
+            self.scores_received.emit(int(fields[1]), -1)
+        elif key == "SCORE_WHITE" and len(fields) >= 2:
+            self.scores_received.emit(-1, int(fields[1]))
+        else:
             self.message_logged.emit(f"Engine: {message}")
-        elif cmd == Response.ERROR:
-            self.error_occurred.emit(message)
-        elif cmd == Response.ANALYSIS:
-            self.message_logged.emit(f"Engine: ANALYSIS received ({len(parts)-1} scores)")
-        elif cmd == Response.INFO:
-            if not any(k in message for k in ["SCORE_BLACK", "SCORE_WHITE"]):
-                self.message_logged.emit(f"Engine: {message}")
-
-        # 2. Logic Dispatch
-        if cmd == Response.BOARD:
-            if len(parts) >= 4:
-                size = int(parts[1])
-                turn = parts[2]
-                state_str = parts[3]
-                self.board_received.emit(size, turn, state_str)
-
-        elif cmd == Response.VALID_MOVES:
-            self.valid_moves_received.emit(parts[1:])
-
-        elif cmd == Response.ANALYSIS:
-            scores = {}
-            for item in parts[1:]:
-                if ":" in item:
-                    coord, score = item.split(":", 1)
-                    scores[coord] = score
-            self.analysis_received.emit(scores)
-
-        elif cmd == Response.INFO:
-            if len(parts) >= 3:
-                key, value = parts[1], parts[2]
-                if key == "SCORE_BLACK":
-                    self.scores_received.emit(int(value), -1)
-                elif key == "SCORE_WHITE":
-                    self.scores_received.emit(-1, int(value))
-
-        elif cmd == Response.RESULT:
-            self.game_over.emit(parts[1])
+
+    def _on_result(self, message: str, payload: str):
+        self.message_logged.emit(f"Engine: {message}")
+        winner = payload.split(maxsplit=1)
+        if winner:
+            self.game_over.emit(winner[0])
 
     def send_command(self, cmd: str):
         self.engine.send_command(cmd)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     board_size: int = 8
     current_turn: str = "BLACK"